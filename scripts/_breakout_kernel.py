@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Compiled kernel for the breakout-quality indicators
+Computes every indicator check_breakout_quality needs in one pass over the
+raw arrays. Uses numba when installed; the same function runs as plain
+NumPy otherwise.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    # numba not installed - leave the function as ordinary Python/NumPy
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def compute_breakout_indicators(close, high, low, vol):
+    """Indicator pass over a ticker's recent bars (newest last).
+
+    Returns (breakout_pct, volume_ratio, sma_10, sma_20, sma_50,
+    prev_high, avg_volume, price_range). Mirrors the old pandas rolling
+    logic: the lookback window is the 20 bars before today, and the
+    consolidation range covers the last 10 of those.
+    """
+    prev_high = high[-21:-1].max()
+    avg_volume = vol[-21:-1].mean()
+    volume_ratio = vol[-1] / avg_volume
+    breakout_pct = (close[-1] - prev_high) / prev_high * 100.0
+
+    sma_10 = close[-10:].mean()
+    sma_20 = close[-20:].mean()
+    sma_50 = close[-50:].mean()
+
+    cons_high = high[-11:-1].max()
+    cons_low = low[-11:-1].min()
+    cons_mean = close[-11:-1].mean()
+    price_range = (cons_high - cons_low) / cons_mean
+
+    return (breakout_pct, volume_ratio, sma_10, sma_20, sma_50,
+            prev_high, avg_volume, price_range)
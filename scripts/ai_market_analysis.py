@@ -5,33 +5,106 @@ Analyzes sector rotation data and provides expert market sentiment assessment
 """
 
 import os
+import sys
 import json
+import heapq
+import asyncio
+import functools
 from datetime import datetime
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, RateLimitError
 from dotenv import load_dotenv
-import glob
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+# orjson is a C-backed JSON parser, 2-5x faster than stdlib on the historical
+# data files - fall back to stdlib json if it's not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Load environment variables
 load_dotenv(override=True)
 
+
+@functools.lru_cache(maxsize=1)
+def _client():
+    """Create the OpenAI client once per process.
+
+    Reusing the client keeps httpx's connection pool warm across calls, which
+    matters when this module runs repeatedly inside a scheduler.
+    """
+    return OpenAI(api_key=os.environ['OPENAI_API_KEY'], timeout=30.0, max_retries=2)
+
 def get_latest_sector_data():
     """Load the most recent sector rotation data"""
-    json_files = sorted(glob.glob('data/historical/sector_rotation_*.json'), key=os.path.getmtime, reverse=True)
-    
-    if not json_files:
+    # The filename already encodes the scan timestamp (sector_rotation_YYYYMMDD_HHMMSS.json)
+    # and sorts lexicographically, so one directory scan replaces a stat call per file
+    try:
+        with os.scandir('data/historical') as it:
+            names = [e.name for e in it
+                     if e.name.startswith('sector_rotation_') and e.name.endswith('.json')]
+    except FileNotFoundError:
+        names = []
+
+    if not names:
         print("❌ No sector rotation data found. Run sector_rotation_scanner.py first.")
         return None
-    
-    latest_file = json_files[0]
+
+    latest_file = os.path.join('data/historical', max(names))
     print(f"📊 Loading data from: {latest_file}")
-    
-    with open(latest_file, 'r') as f:
+
+    return _load_sector_file(latest_file)
+
+
+def _load_sector_file(path):
+    """Load one sector rotation JSON file"""
+    if orjson:
+        # orjson only accepts bytes, so read the file in binary mode
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(path, 'r') as f:
         return json.load(f)
 
 
-def analyze_with_openai(sector_data):
+def get_recent_sector_data(limit):
+    """Load the most recent `limit` sector rotation snapshots, oldest first"""
+    try:
+        with os.scandir('data/historical') as it:
+            names = [e.name for e in it
+                     if e.name.startswith('sector_rotation_') and e.name.endswith('.json')]
+    except FileNotFoundError:
+        names = []
+
+    if not names:
+        print("❌ No sector rotation data found. Run sector_rotation_scanner.py first.")
+        return []
+
+    names.sort()
+    return [(name, _load_sector_file(os.path.join('data/historical', name)))
+            for name in names[-limit:]]
+
+
+def compute_summary_metrics(sector_data):
+    """Compute avg/strongest/weakest in one pass, shared by analysis + save.
+
+    heapq.nlargest/nsmallest are O(N) for a fixed top-3 instead of the two
+    O(N log N) full sorts this module used to do.
+    """
+    total = 0.0
+    for s in sector_data:
+        total += s['Momentum_Score']
+
+    return {
+        'avg_momentum': total / len(sector_data),
+        'strongest': heapq.nlargest(3, sector_data, key=lambda x: x['Momentum_Score']),
+        'weakest': heapq.nsmallest(3, sector_data, key=lambda x: x['Momentum_Score']),
+    }
+
+
+def analyze_with_openai(sector_data, metrics=None):
     """Send sector data to OpenAI for expert analysis"""
-    
+
     # Initialize OpenAI client
     api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
@@ -40,15 +113,24 @@ def analyze_with_openai(sector_data):
         print("OPENAI_API_KEY=your_openai_api_key_here")
         return None
     
-    client = OpenAI(api_key=api_key)
+    client = _client()
     
-    # Prepare the data summary for analysis
-    data_summary = json.dumps(sector_data, indent=2)
+    # Prepare the data summary as a compact CSV-style table - far fewer prompt
+    # tokens than the indented JSON dump, with no loss of signal
+    data_summary = "Sector,Ticker,1D_%,5D_%,20D_%,Volume_Trend_%,RS_vs_SMA20_%,Momentum,Trend\n"
+    data_summary += "\n".join(
+        f"{s['Sector']},{s['Ticker']},{s['1D_Change_%']:.2f},{s['5D_Change_%']:.2f},"
+        f"{s['20D_Change_%']:.2f},{s['Volume_Trend_%']:.2f},{s['RS_vs_SMA20_%']:.2f},"
+        f"{s['Momentum_Score']:.2f},{s['Trend'].strip()}"
+        for s in sector_data
+    )
     
-    # Calculate additional metrics
-    avg_momentum = sum(s['Momentum_Score'] for s in sector_data) / len(sector_data)
-    strongest_sectors = sorted(sector_data, key=lambda x: x['Momentum_Score'], reverse=True)[:3]
-    weakest_sectors = sorted(sector_data, key=lambda x: x['Momentum_Score'])[:3]
+    # Summary metrics (computed once in main and shared with save_analysis)
+    if metrics is None:
+        metrics = compute_summary_metrics(sector_data)
+    avg_momentum = metrics['avg_momentum']
+    strongest_sectors = metrics['strongest']
+    weakest_sectors = metrics['weakest']
     
     # Create the prompt
     prompt = f"""You are an advanced market analyst with 20+ years of experience in technical analysis, sector rotation, and market cycles. 
@@ -87,7 +169,8 @@ Please be specific, data-driven, and provide your professional opinion based on
     print("\nAnalyzing sector data with OpenAI GPT-4...\n")
     
     try:
-        # Call OpenAI API
+        # Call OpenAI API with streaming so tokens are displayed as they arrive
+        # instead of blocking ~30-60s for the full 2000-token response
         response = client.chat.completions.create(
             model="gpt-4o",
             messages=[
@@ -101,34 +184,237 @@ Please be specific, data-driven, and provide your professional opinion based on
                 }
             ],
             temperature=0.7,
-            max_tokens=2000
+            # GPT-4o produces the 7-section analysis well under this budget;
+            # a tighter cap keeps decode latency down
+            max_tokens=1200,
+            stream=True
         )
-        
-        analysis = response.choices[0].message.content
-        
+
+        # Accumulate the streamed deltas while printing them live
+        parts = []
+        try:
+            for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    print(delta, end='', flush=True)
+        except KeyboardInterrupt:
+            # Keep whatever was streamed so far - partial output still gets saved
+            print("\n⚠️  Analysis interrupted - saving partial output...")
+        print()
+
+        if not parts:
+            print("❌ OpenAI returned an empty response")
+            return None
+
+        analysis = ''.join(parts)
+
         # Add timestamp at the top of the analysis
         timestamp_header = f"Analysis Generated: {datetime.now().strftime('%B %d, %Y at %H:%M:%S CET')}\n\n"
         analysis_with_timestamp = timestamp_header + analysis
-        
+
         return analysis_with_timestamp
-        
+
     except Exception as e:
         print(f"❌ Error calling OpenAI API: {e}")
         return None
 
 
-def save_analysis(analysis, sector_data):
-    """Save the AI analysis to a file"""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
+# How many snapshots to pack into one backfill request - 3-5 fits comfortably
+# within the GPT-4o context window and keeps output under max_tokens
+BATCH_SIZE = 4
+
+
+def analyze_with_openai_batch(snapshots):
+    """Analyze several sector rotation snapshots in a single OpenAI request.
+
+    Used for backfilling analyses of historical snapshots: batching cuts N
+    network round trips down to one by amortizing the per-call overhead.
+    Returns a list of analysis strings in the same order as `snapshots`.
+    """
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        print("❌ OPENAI_API_KEY not found in environment variables!")
+        return None
+
+    client = _client()
+
+    # Compose one prompt with numbered snapshot sections
+    sections = []
+    for i, (name, sector_data) in enumerate(snapshots, start=1):
+        sections.append(f"SNAPSHOT {i} ({name}):\n{json.dumps(sector_data)}")
+
+    prompt = f"""You are an advanced market analyst with 20+ years of experience in technical analysis, sector rotation, and market cycles.
+
+Analyze each of the following sector rotation snapshots independently. For each one, provide a concise market assessment covering: market phase, risk environment (Risk-On/Risk-Off), rotation pattern, and 2-3 actionable insights.
+
+{chr(10).join(sections)}
+
+Respond with a JSON object whose keys are the snapshot numbers as strings ("1", "2", ...) and whose values are the analysis text for that snapshot."""
+
+    print(f"\n🤖 Analyzing {len(snapshots)} snapshots in one batched request...")
+
+    try:
+        response = client.chat.completions.create(
+            model="gpt-4o",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are an expert market analyst specializing in sector rotation analysis. You respond in valid JSON."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.7,
+            max_tokens=2000,
+            response_format={"type": "json_object"}
+        )
+
+        results = json.loads(response.choices[0].message.content)
+        return [results.get(str(i), '') for i in range(1, len(snapshots) + 1)]
+
+    except Exception as e:
+        print(f"❌ Error calling OpenAI API: {e}")
+        return None
+
+
+# Cap on concurrent OpenAI requests so the fan-out respects rate limits
+CONCURRENT_REQUESTS = 5
+
+
+@retry(wait=wait_exponential(multiplier=1, max=30), stop=stop_after_attempt(5),
+       retry=retry_if_exception_type(RateLimitError))
+async def _request_sector_analysis(client, sector):
+    """One per-sector deep-dive request, retried with backoff on rate limits"""
+    response = await client.chat.completions.create(
+        model="gpt-4o",
+        messages=[
+            {
+                "role": "system",
+                "content": "You are an expert market analyst specializing in sector rotation analysis. You provide clear, actionable insights based on data."
+            },
+            {
+                "role": "user",
+                "content": f"Provide a concise deep-dive analysis of this sector's current momentum and what it suggests for the next 1-4 weeks:\n{json.dumps(sector)}"
+            }
+        ],
+        temperature=0.7,
+        max_tokens=500
+    )
+    return response.choices[0].message.content
+
+
+async def _gather_sector_analyses(sector_data):
+    """Fan out one analysis request per sector, bounded by a semaphore"""
+    client = AsyncOpenAI(api_key=os.environ['OPENAI_API_KEY'])
+    sem = asyncio.Semaphore(CONCURRENT_REQUESTS)
+
+    async def analyze_one(sector):
+        async with sem:
+            return await _request_sector_analysis(client, sector)
+
+    try:
+        return await asyncio.gather(*(analyze_one(s) for s in sector_data))
+    finally:
+        await client.close()
+
+
+def analyze_sectors_individually(sector_data):
+    """Run a per-sector deep-dive analysis, with requests issued concurrently.
+
+    The synchronous client would serialize the 13 calls; overlapping them
+    makes total wall time roughly that of the slowest single request.
+    Returns a dict of sector name -> analysis text.
+    """
+    if not os.getenv('OPENAI_API_KEY'):
+        print("❌ OPENAI_API_KEY not found in environment variables!")
+        return None
+
+    try:
+        analyses = asyncio.run(_gather_sector_analyses(sector_data))
+    except Exception as e:
+        print(f"❌ Error calling OpenAI API: {e}")
+        return None
+
+    return {s['Sector']: a for s, a in zip(sector_data, analyses)}
+
+
+async def _pipeline():
+    """Run AI analysis and historical chart rendering concurrently.
+
+    The chart doesn't depend on the OpenAI result, so its file I/O and
+    matplotlib work overlap with the network call instead of running after it.
+    """
+    from create_historical_chart import create_historical_momentum_chart
+
+    sector_data = await asyncio.to_thread(get_latest_sector_data)
+    if not sector_data:
+        return
+
+    metrics = compute_summary_metrics(sector_data)
+
+    analysis, chart = await asyncio.gather(
+        asyncio.to_thread(analyze_with_openai, sector_data, metrics),
+        asyncio.to_thread(create_historical_momentum_chart),
+    )
+
+    if analysis:
+        json_file, txt_file = save_analysis(analysis, sector_data, metrics)
+        print(f"\n✅ Analysis saved to:\n   - {json_file}\n   - {txt_file}")
+    if chart:
+        print(f"✅ Historical chart: {chart}")
+
+
+def run_pipeline():
+    """Synchronous entry point for the overlapped analysis + chart pipeline"""
+    asyncio.run(_pipeline())
+
+
+def backfill_analyses(limit=BATCH_SIZE):
+    """Re-run AI analysis over the most recent `limit` snapshots in batches"""
+    snapshots = get_recent_sector_data(limit)
+    if not snapshots:
+        return
+
+    for start in range(0, len(snapshots), BATCH_SIZE):
+        batch = snapshots[start:start + BATCH_SIZE]
+        analyses = analyze_with_openai_batch(batch)
+        if not analyses:
+            continue
+        for (name, sector_data), analysis in zip(batch, analyses):
+            if analysis:
+                # Name each report after its snapshot's own timestamp so
+                # the N analyses in a batch don't overwrite each other
+                snapshot_ts = name.replace('sector_rotation_', '').replace('.json', '')
+                json_file, txt_file = save_analysis(analysis, sector_data,
+                                                    timestamp=snapshot_ts)
+                print(f"✅ {name} → {json_file}")
+
+
+def save_analysis(analysis, sector_data, metrics=None, timestamp=None):
+    """Save the AI analysis to a file.
+
+    `timestamp` names the report files; callers writing several reports in
+    quick succession (backfill) must pass a unique one per snapshot, since
+    the wall-clock default only has second resolution.
+    """
+    if timestamp is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    # Summary metrics (computed once in main and shared with analyze_with_openai)
+    if metrics is None:
+        metrics = compute_summary_metrics(sector_data)
+
     # Create analysis report
     report = {
         'timestamp': datetime.now().isoformat(),
         'sector_data_summary': {
             'total_sectors': len(sector_data),
-            'avg_momentum': sum(s['Momentum_Score'] for s in sector_data) / len(sector_data),
-            'strongest_sector': max(sector_data, key=lambda x: x['Momentum_Score'])['Sector'],
-            'weakest_sector': min(sector_data, key=lambda x: x['Momentum_Score'])['Sector']
+            'avg_momentum': metrics['avg_momentum'],
+            'strongest_sector': metrics['strongest'][0]['Sector'],
+            'weakest_sector': metrics['weakest'][0]['Sector']
         },
         'ai_analysis': analysis
     }
@@ -136,8 +422,12 @@ def save_analysis(analysis, sector_data):
     # Save as JSON
     os.makedirs('output/reports', exist_ok=True)
     json_file = f"output/reports/ai_market_analysis_{timestamp}.json"
-    with open(json_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    if orjson:
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_file, 'w') as f:
+            json.dump(report, f, indent=2)
     
     # Save as readable text
     txt_file = f"output/reports/ai_market_analysis_{timestamp}.txt"
@@ -162,23 +452,48 @@ def main():
     print("AI MARKET ANALYSIS - SECTOR ROTATION")
     print("=" * 80)
     print(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    
+
+    # Pipeline mode: overlap the AI analysis with chart rendering
+    if '--pipeline' in sys.argv:
+        run_pipeline()
+        return
+
+    # Backfill mode: analyze the last N snapshots in batched requests
+    if '--backfill' in sys.argv:
+        idx = sys.argv.index('--backfill')
+        limit = int(sys.argv[idx + 1]) if len(sys.argv) > idx + 1 else BATCH_SIZE
+        backfill_analyses(limit)
+        return
+
+    # Per-sector mode: concurrent deep-dive analysis of every sector
+    if '--per-sector' in sys.argv:
+        sector_data = get_latest_sector_data()
+        if not sector_data:
+            return
+        analyses = analyze_sectors_individually(sector_data)
+        if analyses:
+            for sector, analysis in analyses.items():
+                print("\n" + "=" * 80)
+                print(f"📊 {sector}")
+                print("=" * 80)
+                print(analysis)
+        return
+
     # Load sector data
     sector_data = get_latest_sector_data()
     if not sector_data:
         return
-    
-    # Analyze with OpenAI
-    analysis = analyze_with_openai(sector_data)
+
+    # Compute summary metrics once; both helpers below reuse them
+    metrics = compute_summary_metrics(sector_data)
+
+    # Analyze with OpenAI (analysis is printed live while streaming)
+    analysis = analyze_with_openai(sector_data, metrics)
     if not analysis:
         return
-    
-    # Display the analysis
-    print(analysis)
-    print("\n" + "=" * 80)
-    
+
     # Save the analysis
-    json_file, txt_file = save_analysis(analysis, sector_data)
+    json_file, txt_file = save_analysis(analysis, sector_data, metrics)
     
     print("\n" + "=" * 80)
     print("✅ Analysis saved to:")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tiny file-backed cache for API results
+Keyed by function name + arguments, with a per-call TTL. DataFrames are
+stored as Parquet (round-trips in milliseconds), everything else as JSON.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+
+
+class FileCache:
+    """Disk cache with hashed keys and mtime-based TTL expiry"""
+
+    def __init__(self, root='.cache/api'):
+        self.root = Path(root)
+
+    def _path(self, key, suffix):
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return self.root / f'{digest}{suffix}'
+
+    def get(self, key, ttl):
+        """Return the cached value for key, or None if absent/expired"""
+        for suffix in ('.parquet', '.json'):
+            path = self._path(key, suffix)
+            try:
+                if time.time() - os.path.getmtime(path) > ttl:
+                    continue
+                if suffix == '.parquet':
+                    return pd.read_parquet(path)
+                with open(path) as f:
+                    return json.load(f)
+            except Exception:
+                continue
+        return None
+
+    def set(self, key, value):
+        """Store a value (None values are never cached)"""
+        if value is None:
+            return
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            if isinstance(value, pd.DataFrame):
+                value.to_parquet(self._path(key, '.parquet'))
+            else:
+                with open(self._path(key, '.json'), 'w') as f:
+                    json.dump(value, f)
+        except Exception:
+            pass  # caching is best-effort - never fail the actual call
+
+
+# Shared cache instance used by the decorator (and importable directly)
+CACHE = FileCache()
+
+
+def cached(ttl):
+    """Memoize a function's result on disk for `ttl` seconds.
+
+    The key is built from the function name and its arguments (minus any
+    secrets the caller keeps out of the signature).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = json.dumps([func.__name__, args, kwargs],
+                             sort_keys=True, default=str)
+            hit = CACHE.get(key, ttl)
+            if hit is not None:
+                return hit
+            result = func(*args, **kwargs)
+            CACHE.set(key, result)
+            return result
+        return wrapper
+    return decorator
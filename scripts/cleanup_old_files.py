@@ -4,27 +4,67 @@ Cleanup old data files - keep only last 7 days
 """
 
 import os
-import glob
+import re
 from datetime import datetime, timedelta
 
-def cleanup_old_files(folder_pattern, days_to_keep=7):
-    """Remove files older than specified days"""
+# All generated files end in a _YYYYMMDD_HHMMSS timestamp before the extension
+TIMESTAMP_RE = re.compile(r'(\d{8}_\d{6})\.\w+$')
+
+
+def parse_name_timestamp(name):
+    """Parse the timestamp embedded in a generated filename, or None"""
+    match = TIMESTAMP_RE.search(name)
+    if match:
+        ts = match.group(1)
+        try:
+            # Fixed YYYYMMDD_HHMMSS layout - slicing beats strptime
+            return datetime(int(ts[0:4]), int(ts[4:6]), int(ts[6:8]),
+                            int(ts[9:11]), int(ts[11:13]), int(ts[13:15]))
+        except ValueError:
+            pass
+    return None
+
+
+def file_timestamp(file_path):
+    """Get a file's age from the timestamp in its name, falling back to mtime"""
+    ts = parse_name_timestamp(os.path.basename(file_path))
+    if ts is not None:
+        return ts
+    # Not a timestamped name - pay the stat call for this one
+    return datetime.fromtimestamp(os.path.getmtime(file_path))
+
+
+def cleanup_dir(dirpath, suffixes, days_to_keep=7):
+    """Remove files with the given suffixes older than specified days.
+
+    One scandir covers every extension in the directory, and the age check
+    prefers the filename timestamp over a stat call per file.
+    """
     cutoff_date = datetime.now() - timedelta(days=days_to_keep)
     removed_count = 0
-    
-    files = glob.glob(folder_pattern)
-    
-    for file_path in files:
-        file_mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
-        
-        if file_mtime < cutoff_date:
-            try:
-                os.remove(file_path)
-                print(f"🗑️  Removed old file: {file_path}")
-                removed_count += 1
-            except Exception as e:
-                print(f"❌ Error removing {file_path}: {e}")
-    
+
+    try:
+        entries = os.scandir(dirpath)
+    except FileNotFoundError:
+        return 0
+
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(suffixes) or not entry.is_file():
+                continue
+
+            ts = parse_name_timestamp(entry.name)
+            if ts is None:
+                ts = datetime.fromtimestamp(entry.stat().st_mtime)
+
+            if ts < cutoff_date:
+                try:
+                    os.unlink(entry.path)
+                    print(f"🗑️  Removed old file: {entry.path}")
+                    removed_count += 1
+                except OSError as e:
+                    print(f"❌ Error removing {entry.path}: {e}")
+
     return removed_count
 
 
@@ -33,27 +73,25 @@ def main():
     print("=" * 80)
     print("CLEANUP OLD FILES - Keep Last 7 Days")
     print("=" * 80)
-    
+
     total_removed = 0
-    
+
     # Clean up data/historical
     print("\n📂 Cleaning data/historical/...")
-    total_removed += cleanup_old_files('data/historical/*.csv')
-    total_removed += cleanup_old_files('data/historical/*.json')
-    
+    total_removed += cleanup_dir('data/historical', ('.csv', '.json'))
+
     # Clean up output/charts
     print("\n📂 Cleaning output/charts/...")
-    total_removed += cleanup_old_files('output/charts/*.png')
-    
+    total_removed += cleanup_dir('output/charts', ('.png',))
+
     # Clean up output/heatmaps
     print("\n📂 Cleaning output/heatmaps/...")
-    total_removed += cleanup_old_files('output/heatmaps/*.png')
-    
+    total_removed += cleanup_dir('output/heatmaps', ('.png',))
+
     # Clean up output/reports
     print("\n📂 Cleaning output/reports/...")
-    total_removed += cleanup_old_files('output/reports/*.json')
-    total_removed += cleanup_old_files('output/reports/*.txt')
-    
+    total_removed += cleanup_dir('output/reports', ('.json', '.txt'))
+
     print("\n" + "=" * 80)
     print(f"✅ Cleanup complete! Removed {total_removed} old files.")
     print("=" * 80)
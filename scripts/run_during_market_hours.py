@@ -5,52 +5,64 @@ US Stock Market: 9:30 AM - 4:00 PM EST (Monday-Friday)
 """
 
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import subprocess
 import sys
 
+# Cached timezone object - built once instead of being looked up per call,
+# which matters if this check ever runs inside a polling loop
+EASTERN = ZoneInfo('America/New_York')
+
+
 def is_market_open():
     """
     Check if US stock market is currently open or within 30 minutes after close
     Returns: (bool, str) - (is_open, reason)
     """
     # Get current time in US Eastern timezone
-    eastern = pytz.timezone('US/Eastern')
-    now = datetime.now(eastern)
-    
+    now = datetime.now(EASTERN)
+
     # Check if it's a weekday (Monday=0, Sunday=6)
     if now.weekday() >= 5:  # Saturday or Sunday
         return False, f"Market closed: Weekend ({now.strftime('%A')})"
-    
+
     # Market hours: 9:30 AM - 4:00 PM EST
-    # Allow running up to 30 minutes after close to capture closing data
-    market_open_time = now.replace(hour=9, minute=30, second=0, microsecond=0)
-    market_close_time = now.replace(hour=16, minute=0, second=0, microsecond=0)
-    market_close_buffer = now.replace(hour=16, minute=30, second=0, microsecond=0)
-    
-    if now < market_open_time:
+    # Allow running up to 30 minutes after close to capture closing data.
+    # Comparing (hour, minute) tuples avoids allocating boundary datetimes
+    # via .replace() on every call
+    hm = (now.hour, now.minute)
+
+    if hm < (9, 30):
         return False, f"Market not open yet (opens at 9:30 AM EST, currently {now.strftime('%I:%M %p EST')})"
-    elif now > market_close_buffer:
+    elif hm > (16, 30):
         return False, f"Market closed (closed at 4:00 PM EST, currently {now.strftime('%I:%M %p EST')})"
-    elif now > market_close_time:
+    elif hm >= (16, 0):
         return True, f"Market closed, capturing closing data (current time: {now.strftime('%I:%M %p EST')})"
     else:
         return True, f"Market is open (current time: {now.strftime('%I:%M %p EST')})"
 
 
-def run_scanner():
+def run_scanner(isolate=False):
     """Run the sector rotation scanner"""
     print("=" * 80)
     print("🚀 Starting Sector Rotation Scanner...")
     print("=" * 80)
-    
+
     try:
-        # Run the scanner
-        result = subprocess.run(['python3', 'scripts/sector_rotation_scanner.py'], 
-                              capture_output=False, 
-                              text=True)
-        
-        if result.returncode == 0:
+        if isolate:
+            # Spawn a fresh interpreter for crash isolation (old behavior)
+            result = subprocess.run(['python3', 'scripts/sector_rotation_scanner.py'],
+                                  capture_output=False,
+                                  text=True)
+            success = result.returncode == 0
+        else:
+            # Run in-process - skips interpreter startup plus the cold
+            # pandas/matplotlib imports a new interpreter would pay
+            from sector_rotation_scanner import main as scanner_main
+            scanner_main()
+            success = True
+
+        if success:
             print("\n" + "=" * 80)
             print("✅ Scanner completed successfully!")
             print("=" * 80)
@@ -60,7 +72,9 @@ def run_scanner():
             print("❌ Scanner failed!")
             print("=" * 80)
             return False
-            
+
+    except SystemExit as e:
+        return e.code in (0, None)
     except Exception as e:
         print(f"\n❌ Error running scanner: {e}")
         return False
@@ -77,7 +91,7 @@ def main():
     
     if is_open:
         print("✅ Market is open - Running scanner...\n")
-        success = run_scanner()
+        success = run_scanner(isolate='--isolate' in sys.argv)
         sys.exit(0 if success else 1)
     else:
         print("⏰ Market is closed - Scanner will not run.")
@@ -17,13 +17,77 @@ import os
 import sys
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
+from pathlib import Path
 import json
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+
+# orjson serializes dict-of-lists payloads much faster than pandas' to_json
+# path and handles numpy scalars natively - fall back if not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import textwrap
+from jinja2 import Environment, FileSystemBytecodeCache
+
+# Shared Jinja environment, compiled once per process with an on-disk
+# bytecode cache (same cache dir generate_pages.py uses)
+Path('.jinja_cache').mkdir(exist_ok=True)
+_ENV = Environment(auto_reload=False, trim_blocks=True, lstrip_blocks=True,
+                   bytecode_cache=FileSystemBytecodeCache('.jinja_cache'))
+
+# Markdown body for the ClickUp task - rendering over to_dict('records')
+# replaces the old iterrows() string-append loops
+_CLICKUP_TMPL = _ENV.from_string(textwrap.dedent("""\
+    # 📊 Sector Rotation Analysis
+    **Scan Time:** {{ timestamp }}
+
+    ## 🚀 Strongest Sectors (Long Opportunities)
+
+    {% for r in top %}
+    ### {{ r['Sector'] }} ({{ r['Symbol'] }})
+    - **Score:** {{ '%.2f'|format(r['Score']) }}%
+    - **1 Day:** {{ '%+.2f'|format(r['1D %']) }}%
+    - **5 Days:** {{ '%+.2f'|format(r['5D %']) }}%
+    - **20 Days:** {{ '%+.2f'|format(r['20D %']) }}%
+    - **vs SMA20:** {{ '%+.2f'|format(r['vs SMA20']) }}%
+
+    {% endfor %}
+    ## ⚠️ Weakest Sectors (Avoid/Short)
+
+    {% for r in bottom %}
+    ### {{ r['Sector'] }} ({{ r['Symbol'] }})
+    - **Score:** {{ '%.2f'|format(r['Score']) }}%
+    - **1 Day:** {{ '%+.2f'|format(r['1D %']) }}%
+    - **5 Days:** {{ '%+.2f'|format(r['5D %']) }}%
+    - **20 Days:** {{ '%+.2f'|format(r['20D %']) }}%
+    - **vs SMA20:** {{ '%+.2f'|format(r['vs SMA20']) }}%
+
+    {% endfor %}
+    ## 📈 Market Sentiment: {{ sentiment }}
+    {{ sentiment_desc }}
+
+    **Positive Sectors:** {{ positive_count }}/{{ total }}
+    **Average Score:** {{ '%.2f'|format(avg_score) }}%
+
+    ## 💡 Trading Strategy
+    - **Rotate Into:** Top 3 sectors
+    - **Rotate Out Of:** Bottom 3 sectors
+    - **Look for stocks in:** {{ top_sectors }}
+
+    ---
+    *Auto-generated by Sector Rotation Scanner*
+    *Chart attached below ⬇️*
+    """))
 import base64
 from dotenv import load_dotenv
 
@@ -39,33 +103,68 @@ load_dotenv(override=True)
 API_KEY = os.getenv('ALPHAVANTAGE_API_KEY')
 BASE_URL = 'https://www.alphavantage.co/query'
 
+# Shared session - reuses TCP/TLS connections across all Alpha Vantage calls
+# instead of paying a fresh handshake per request. Retries fire only when the
+# server actually signals back-pressure (429/5xx), with exponential backoff,
+# so transient failures stop silently dropping sectors
+_RETRY = Retry(total=3, backoff_factor=0.5,
+               status_forcelist=(429, 500, 502, 503, 504),
+               allowed_methods=('GET',))
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(max_retries=_RETRY,
+                                      pool_connections=16, pool_maxsize=16))
+
+# How many fetches to keep in flight at once (Alpha Vantage limits are
+# per-minute, so a handful of concurrent requests is fine)
+MAX_CONCURRENT_FETCHES = 5
+
 # ClickUp Configuration
 CLICKUP_API_TOKEN = os.environ.get('CLICKUP_API_TOKEN', '')
 CLICKUP_LIST_ID = os.environ.get('CLICKUP_LIST_ID', '')  # Will need to set this
 
-# Major Sector ETFs
-SECTOR_ETFS = {
-    'XLK': 'Technology',
-    'XLF': 'Financials',
-    'XLV': 'Healthcare',
-    'XLE': 'Energy',
-    'XLI': 'Industrials',
-    'XLP': 'Consumer Staples',
-    'XLY': 'Consumer Discretionary',
-    'XLB': 'Materials',
-    'XLRE': 'Real Estate',
-    'XLU': 'Utilities',
-    'XLC': 'Communication Services',
-    'KRE': 'Regional Banks',
-    'IBB': 'Biotech'
-}
+# Major Sector ETFs - two frozen parallel tuples (structure-of-arrays) so
+# iteration is positional and each name string exists exactly once
+SECTOR_SYMBOLS = ('XLK', 'XLF', 'XLV', 'XLE', 'XLI', 'XLP', 'XLY',
+                  'XLB', 'XLRE', 'XLU', 'XLC', 'KRE', 'IBB')
+SECTOR_NAMES = ('Technology', 'Financials', 'Healthcare', 'Energy',
+                'Industrials', 'Consumer Staples', 'Consumer Discretionary',
+                'Materials', 'Real Estate', 'Utilities',
+                'Communication Services', 'Regional Banks', 'Biotech')
 
 # ============================================================================
 # DATA FETCHING
 # ============================================================================
 
+# Daily bars only change once per trading day, so cache the parsed frame on
+# disk keyed by (symbol, today); the hourly scheduled runs after the first of
+# the day skip the network entirely
+CACHE_DIR = Path('.cache/alphavantage')
+
+
 def fetch_sector_data(symbol: str) -> pd.DataFrame:
-    """Fetch daily data for sector ETF."""
+    """Fetch daily data for sector ETF, cached on disk per day."""
+    key = CACHE_DIR / f'{symbol}_{date.today().isoformat()}.parquet'
+
+    if key.exists():
+        try:
+            return pd.read_parquet(key)
+        except Exception:
+            pass  # corrupt cache entry - refetch
+
+    df = _fetch_sector_data_remote(symbol)
+
+    if df is not None:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(key)
+        except Exception as e:
+            print(f"⚠ Could not cache {symbol}: {e}")
+
+    return df
+
+
+def _fetch_sector_data_remote(symbol: str) -> pd.DataFrame:
+    """Fetch daily data for sector ETF from Alpha Vantage."""
     try:
         params = {
             'function': 'TIME_SERIES_DAILY',
@@ -74,22 +173,27 @@ def fetch_sector_data(symbol: str) -> pd.DataFrame:
             'apikey': API_KEY
         }
         
-        response = requests.get(BASE_URL, params=params, timeout=10)
+        response = SESSION.get(BASE_URL, params=params, timeout=10)
         data = response.json()
         
         if 'Time Series (Daily)' not in data:
             return None
-        
+
         time_series = data['Time Series (Daily)']
-        df = pd.DataFrame.from_dict(time_series, orient='index')
-        df.columns = ['open', 'high', 'low', 'close', 'volume']
-        
-        for col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        df.index = pd.to_datetime(df.index)
-        df = df.sort_index()
-        
+
+        # Build typed arrays in one pass - the from_dict route creates an
+        # object-dtype frame and then rewrites all five columns via
+        # to_numeric; sorting the ISO date keys up front also replaces the
+        # post-hoc sort_index
+        items = sorted(time_series.items())
+        idx = pd.DatetimeIndex([k for k, _ in items])
+        vals = np.fromiter(
+            (float(v[k]) for _, v in items
+             for k in ('1. open', '2. high', '3. low', '4. close', '5. volume')),
+            dtype=np.float64, count=len(items) * 5).reshape(-1, 5)
+        df = pd.DataFrame(vals, index=idx,
+                          columns=['open', 'high', 'low', 'close', 'volume'])
+
         return df
         
     except Exception as e:
@@ -105,73 +209,115 @@ def calculate_sector_metrics(df: pd.DataFrame, period: int = 20) -> dict:
     """Calculate performance metrics for a sector."""
     if df is None or len(df) < period:
         return None
-    
-    current_price = df['close'].iloc[-1]
-    
+
+    # Pull the raw NumPy arrays once - every pandas .iloc/.tail() lookup
+    # constructs a Series and pays dispatch overhead, which dominates the
+    # cost of this function on the ~100-row compact payload
+    close = df['close'].to_numpy()
+    high = df['high'].to_numpy()
+    low = df['low'].to_numpy()
+    volume = df['volume'].to_numpy()
+    n = close.shape[0]
+
+    current_price = close[-1]
+
     # Performance metrics
     metrics = {
-        '1_day': ((df['close'].iloc[-1] / df['close'].iloc[-2]) - 1) * 100 if len(df) >= 2 else 0,
-        '5_day': ((df['close'].iloc[-1] / df['close'].iloc[-6]) - 1) * 100 if len(df) >= 6 else 0,
-        '20_day': ((df['close'].iloc[-1] / df['close'].iloc[-21]) - 1) * 100 if len(df) >= 21 else 0,
+        '1_day': ((close[-1] / close[-2]) - 1) * 100 if n >= 2 else 0,
+        '5_day': ((close[-1] / close[-6]) - 1) * 100 if n >= 6 else 0,
+        '20_day': ((close[-1] / close[-21]) - 1) * 100 if n >= 21 else 0,
         'current_price': current_price,
-        'avg_volume': df['volume'].tail(20).mean()
+        'avg_volume': volume[-20:].mean()
     }
-    
+
     # Relative strength
-    sma_20 = df['close'].tail(20).mean()
+    sma_20 = close[-20:].mean()
     metrics['vs_sma20'] = ((current_price / sma_20) - 1) * 100
-    
+
     # Momentum
-    recent_high = df['high'].tail(20).max()
-    recent_low = df['low'].tail(20).min()
+    recent_high = high[-20:].max()
+    recent_low = low[-20:].min()
     metrics['pct_from_high'] = ((current_price / recent_high) - 1) * 100
     metrics['pct_from_low'] = ((current_price / recent_low) - 1) * 100
-    
+
+    # Composite score - computed once here so ranking and logging read the
+    # same number instead of re-deriving the formula in three places
+    metrics['score'] = (metrics['1_day'] * 0.3 +
+                        metrics['5_day'] * 0.4 +
+                        metrics['20_day'] * 0.3)
+
     return metrics
 
 
 def rank_sectors(sector_data: dict) -> pd.DataFrame:
     """Rank sectors by performance."""
-    rankings = []
-    
+    # Collect column-wise lists and build the DataFrame from typed arrays -
+    # no per-sector dict construction, and the composite Score is one fused
+    # NumPy expression instead of per-row arithmetic
+    syms, names, d1, d5, d20, rs, scores = [], [], [], [], [], [], []
+
     for symbol, data in sector_data.items():
-        if data and data['metrics']:
-            rankings.append({
-                'Symbol': symbol,
-                'Sector': data['sector_name'],
-                '1D %': data['metrics']['1_day'],
-                '5D %': data['metrics']['5_day'],
-                '20D %': data['metrics']['20_day'],
-                'vs SMA20': data['metrics']['vs_sma20'],
-                'Score': (data['metrics']['1_day'] * 0.3 + 
-                         data['metrics']['5_day'] * 0.4 + 
-                         data['metrics']['20_day'] * 0.3)
-            })
-    
-    df = pd.DataFrame(rankings)
-    df = df.sort_values('Score', ascending=False)
-    return df
+        if not (data and data['metrics']):
+            continue
+        m = data['metrics']
+        syms.append(symbol)
+        names.append(data['sector_name'])
+        d1.append(m['1_day'])
+        d5.append(m['5_day'])
+        d20.append(m['20_day'])
+        rs.append(m['vs_sma20'])
+        scores.append(m['score'])
+
+    score = np.asarray(scores)
+
+    df = pd.DataFrame({
+        'Symbol': syms,
+        'Sector': names,
+        '1D %': np.asarray(d1),
+        '5D %': np.asarray(d5),
+        '20D %': np.asarray(d20),
+        'vs SMA20': np.asarray(rs),
+        'Score': score
+    })
+
+    # argsort on the score array replaces a full pandas sort_values pass
+    order = np.argsort(-score)
+    return df.iloc[order].reset_index(drop=True)
 
 
 # ============================================================================
 # CHART GENERATION
 # ============================================================================
 
+# Recycled across chart calls - rebuilding the Figure (axes, canvas, font
+# cache) costs ~200ms per render in a long-lived process
+_FIG = None
+
+
 def create_sector_rotation_chart(rankings_df: pd.DataFrame) -> str:
     """Create visual chart of sector performance and save to file."""
-    
+    global _FIG
+
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     output_dir = 'results'
     os.makedirs(output_dir, exist_ok=True)
-    chart_path = f"{output_dir}/sector_rotation_chart_{timestamp}.png"
-    
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+    # SVG: smaller than the 150-dpi PNG, scales cleanly in the browser, and
+    # skips the rasterization pass inside savefig
+    chart_path = f"{output_dir}/sector_rotation_chart_{timestamp}.svg"
+
+    if _FIG is None:
+        _FIG = plt.figure(figsize=(14, 10))
+    else:
+        # Clear instead of close - keeps the cached figure/canvas alive
+        _FIG.clf()
+    fig = _FIG
+    ax1, ax2 = fig.subplots(2, 1)
     fig.suptitle('📊 Sector Rotation Analysis', fontsize=16, fontweight='bold')
-    
+
     # Chart 1: Performance Comparison
     sectors = rankings_df['Sector'].values
     scores = rankings_df['Score'].values
-    colors = ['green' if s > 0 else 'red' for s in scores]
+    colors = np.where(scores > 0, '#10b981', '#ef4444')
     
     bars = ax1.barh(sectors, scores, color=colors, alpha=0.7, edgecolor='black')
     ax1.set_xlabel('Composite Score', fontsize=12, fontweight='bold')
@@ -179,13 +325,9 @@ def create_sector_rotation_chart(rankings_df: pd.DataFrame) -> str:
     ax1.axvline(x=0, color='black', linestyle='-', linewidth=0.8)
     ax1.grid(axis='x', alpha=0.3)
     
-    # Add value labels
-    for i, (bar, score) in enumerate(zip(bars, scores)):
-        label = f'{score:+.2f}%'
-        x_pos = score + (0.1 if score > 0 else -0.1)
-        ax1.text(x_pos, bar.get_y() + bar.get_height()/2, label,
-                va='center', ha='left' if score > 0 else 'right',
-                fontsize=9, fontweight='bold')
+    # Add value labels - one bar_label call instead of a Text artist per bar
+    ax1.bar_label(bars, labels=[f'{s:+.2f}%' for s in scores], padding=3,
+                  fontsize=9, fontweight='bold')
     
     # Chart 2: Multi-timeframe Heatmap
     timeframes = ['1D %', '5D %', '20D %']
@@ -200,19 +342,19 @@ def create_sector_rotation_chart(rankings_df: pd.DataFrame) -> str:
     ax2.set_yticklabels(timeframes)
     ax2.set_title('Performance Heatmap (Green=Strong, Red=Weak)', fontsize=12)
     
-    # Add text annotations
+    # Add text annotations - formatting and color selection are vectorized
+    # up front so the loop body is just the matplotlib dispatch
+    labels = np.char.mod('%.1f%%', heatmap_data)
+    text_colors = np.where(np.abs(heatmap_data) > 2, 'white', 'black')
     for i in range(len(timeframes)):
         for j in range(len(sectors)):
-            value = heatmap_data[i, j]
-            text_color = 'white' if abs(value) > 2 else 'black'
-            ax2.text(j, i, f'{value:.1f}%',
+            ax2.text(j, i, labels[i, j],
                     ha='center', va='center',
-                    color=text_color, fontsize=9, fontweight='bold')
+                    color=text_colors[i, j], fontsize=9, fontweight='bold')
     
-    plt.colorbar(im, ax=ax2, label='Performance %')
-    plt.tight_layout()
-    plt.savefig(chart_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.colorbar(im, ax=ax2, label='Performance %')
+    fig.tight_layout()
+    fig.savefig(chart_path, bbox_inches='tight')
     
     print(f"✓ Chart saved: {chart_path}")
     return chart_path
@@ -273,43 +415,11 @@ def post_to_clickup(rankings_df: pd.DataFrame, chart_path: str) -> bool:
         # Identify top 3 and bottom 3
         top_3 = rankings_df.head(3)
         bottom_3 = rankings_df.tail(3)
-        
-        # Build task description
-        description = f"""# 📊 Sector Rotation Analysis
-**Scan Time:** {timestamp}
 
-## 🚀 Strongest Sectors (Long Opportunities)
-
-"""
-        
-        for _, row in top_3.iterrows():
-            description += f"""### {row['Sector']} ({row['Symbol']})
-- **Score:** {row['Score']:.2f}%
-- **1 Day:** {row['1D %']:+.2f}%
-- **5 Days:** {row['5D %']:+.2f}%
-- **20 Days:** {row['20D %']:+.2f}%
-- **vs SMA20:** {row['vs SMA20']:+.2f}%
-
-"""
-        
-        description += """## ⚠️ Weakest Sectors (Avoid/Short)
-
-"""
-        
-        for _, row in bottom_3.iterrows():
-            description += f"""### {row['Sector']} ({row['Symbol']})
-- **Score:** {row['Score']:.2f}%
-- **1 Day:** {row['1D %']:+.2f}%
-- **5 Days:** {row['5D %']:+.2f}%
-- **20 Days:** {row['20D %']:+.2f}%
-- **vs SMA20:** {row['vs SMA20']:+.2f}%
-
-"""
-        
         # Market sentiment
         avg_score = rankings_df['Score'].mean()
         positive_count = len(rankings_df[rankings_df['Score'] > 0])
-        
+
         if avg_score > 1:
             sentiment = "🟢 RISK-ON"
             sentiment_desc = "Broad market strength, favor aggressive sectors"
@@ -319,23 +429,20 @@ def post_to_clickup(rankings_df: pd.DataFrame, chart_path: str) -> bool:
         else:
             sentiment = "🟡 NEUTRAL"
             sentiment_desc = "Mixed market, selective opportunities"
-        
-        description += f"""## 📈 Market Sentiment: {sentiment}
-{sentiment_desc}
-
-**Positive Sectors:** {positive_count}/{len(rankings_df)}
-**Average Score:** {avg_score:.2f}%
 
-## 💡 Trading Strategy
-- **Rotate Into:** Top 3 sectors
-- **Rotate Out Of:** Bottom 3 sectors
-- **Look for stocks in:** {', '.join(top_3['Sector'].values)}
+        # Render the task description from the precompiled template
+        description = _CLICKUP_TMPL.render(
+            timestamp=timestamp,
+            top=top_3.to_dict('records'),
+            bottom=bottom_3.to_dict('records'),
+            sentiment=sentiment,
+            sentiment_desc=sentiment_desc,
+            positive_count=positive_count,
+            total=len(rankings_df),
+            avg_score=avg_score,
+            top_sectors=', '.join(top_3['Sector'].values),
+        )
 
----
-*Auto-generated by Sector Rotation Scanner*
-*Chart attached below ⬇️*
-"""
-        
         # Create task
         headers = {
             'Authorization': CLICKUP_API_TOKEN,
@@ -388,28 +495,32 @@ def scan_sectors():
     print("SECTOR ROTATION SCANNER with ClickUp Integration")
     print("="*80 + "\n")
     
-    print(f"Scanning {len(SECTOR_ETFS)} sector ETFs...\n")
+    print(f"Scanning {len(SECTOR_SYMBOLS)} sector ETFs...\n")
     
+    # Fetch all ETFs concurrently - the work is network-bound, so the wall
+    # time collapses to roughly the slowest single request instead of the
+    # sum of 13 round trips plus rate-limit sleeps
     sector_data = {}
-    
-    for symbol, sector_name in SECTOR_ETFS.items():
-        print(f"Fetching {symbol} ({sector_name})...", end=' ')
-        
-        df = fetch_sector_data(symbol)
-        metrics = calculate_sector_metrics(df) if df is not None else None
-        
-        sector_data[symbol] = {
-            'sector_name': sector_name,
-            'data': df,
-            'metrics': metrics
-        }
-        
-        if metrics:
-            print(f"✓ Score: {metrics['1_day']*0.3 + metrics['5_day']*0.4 + metrics['20_day']*0.3:+.2f}%")
-        else:
-            print("✗ No data")
-        
-        time.sleep(0.5)  # Rate limiting
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+        futures = {executor.submit(fetch_sector_data, symbol): (symbol, sector_name)
+                   for symbol, sector_name in zip(SECTOR_SYMBOLS, SECTOR_NAMES)}
+
+        for future in as_completed(futures):
+            symbol, sector_name = futures[future]
+            df = future.result()
+            metrics = calculate_sector_metrics(df) if df is not None else None
+
+            sector_data[symbol] = {
+                'sector_name': sector_name,
+                'data': df,
+                'metrics': metrics
+            }
+
+            if metrics:
+                print(f"Fetched {symbol} ({sector_name}) ✓ Score: {metrics['score']:+.2f}%")
+            else:
+                print(f"Fetched {symbol} ({sector_name}) ✗ No data")
     
     # Rank sectors
     print("\n" + "="*80)
@@ -433,21 +544,48 @@ def scan_sectors():
     print(f"Positive Sectors: {positive}/{len(rankings_df)}")
     print("="*80)
     
-    # Create chart
-    print("\n📊 Generating sector rotation chart...")
-    chart_path = create_sector_rotation_chart(rankings_df)
-    
-    # Save CSV
+    # Create chart + save CSV/JSON concurrently - the chart render is
+    # CPU-bound matplotlib work, so the two serialization writes overlap
+    # with it instead of waiting for it
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    os.makedirs('results', exist_ok=True)
     csv_path = f"results/sector_rotation_{timestamp}.csv"
-    rankings_df.to_csv(csv_path, index=False)
-    print(f"✓ Data saved: {csv_path}")
-    
-    # Save JSON
     json_path = f"results/sector_rotation_{timestamp}.json"
-    rankings_df.to_json(json_path, orient='records', indent=2)
+
+    def _write_json():
+        if orjson:
+            Path(json_path).write_bytes(
+                orjson.dumps(rankings_df.to_dict(orient='records'),
+                             option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            rankings_df.to_json(json_path, orient='records', indent=2)
+
+    print("\n📊 Generating sector rotation chart...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        fut_chart = executor.submit(create_sector_rotation_chart, rankings_df)
+        fut_csv = executor.submit(rankings_df.to_csv, csv_path, index=False)
+        fut_json = executor.submit(_write_json)
+        chart_path = fut_chart.result()
+        fut_csv.result()
+        fut_json.result()
+
+    print(f"✓ Data saved: {csv_path}")
     print(f"✓ Data saved: {json_path}")
-    
+
+    # Columnar history - one zstd-compressed Parquet file accumulates every
+    # scan, so rebuilding historical trends is a single columnar read instead
+    # of re-parsing hundreds of per-scan JSON files with repeated keys
+    try:
+        history_path = Path('results/history.parquet')
+        snapshot = rankings_df.assign(date=pd.Timestamp.now('UTC').normalize())
+        if history_path.exists():
+            snapshot = pd.concat([pd.read_parquet(history_path), snapshot],
+                                 ignore_index=True)
+        snapshot.to_parquet(history_path, compression='zstd', index=False)
+        print(f"✓ History updated: {history_path}")
+    except Exception as e:
+        print(f"⚠ Could not update history parquet: {e}")
+
     # Post to ClickUp
     print("\n📤 Posting results to ClickUp...")
     success = post_to_clickup(rankings_df, chart_path)
@@ -8,14 +8,41 @@ Smart Sector Breakout Scanner
 5. Ranks by probability/quality
 """
 
+import asyncio
+from dataclasses import dataclass
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import json
-import time
 import os
 from dotenv import load_dotenv
 
+from cache import CACHE, cached
+from _breakout_kernel import compute_breakout_indicators
+
+# orjson decodes the multi-hundred-KB API payloads 2-5x faster than the
+# stdlib json behind response.json() - fall back when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _decode_response(response):
+    """Decode an API response body (orjson when available)"""
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Daily bars change once per trading day; news is fresher
+DAILY_TTL = 86400
+NEWS_TTL = 3600
+
 # Load environment variables from .env file
 # override=True ensures .env file takes precedence over existing environment variables
 load_dotenv(override=True)
@@ -24,6 +51,16 @@ load_dotenv(override=True)
 API_KEY = os.getenv('ALPHAVANTAGE_API_KEY')
 BASE_URL = 'https://www.alphavantage.co/query'
 
+# One shared session for the synchronous calls - the TLS handshake is paid
+# once instead of per request, and 429/5xx responses get retried with
+# backoff instead of silently dropping a ticker
+_RETRY = Retry(total=3, backoff_factor=0.5,
+               status_forcelist=(429, 500, 502, 503, 504),
+               allowed_methods=('GET',))
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'sector-scanner/1.0'})
+SESSION.mount('https://', HTTPAdapter(max_retries=_RETRY))
+
 # Major Sector ETFs and their top holdings
 SECTOR_ETFS = {
     'XLK': 'Technology',
@@ -64,36 +101,149 @@ SECTOR_STOCKS = {
 }
 
 
+@dataclass
+class Bars:
+    """Struct-of-arrays view of a ticker's recent bars (newest last).
+
+    The analysis functions only ever read whole columns, so handing them
+    typed arrays directly skips the per-call DataFrame column extraction
+    and feeds the compiled kernel without pandas in the middle.
+    """
+    index: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_frame(cls, df):
+        return cls(index=df.index.to_numpy(),
+                   open=df['Open'].to_numpy(),
+                   high=df['High'].to_numpy(),
+                   low=df['Low'].to_numpy(),
+                   close=df['Close'].to_numpy(),
+                   volume=df['Volume'].to_numpy())
+
+    def __len__(self):
+        return len(self.close)
+
+    def tail(self, n):
+        return Bars(self.index[-n:], self.open[-n:], self.high[-n:],
+                    self.low[-n:], self.close[-n:], self.volume[-n:])
+
+
+def _parse_daily_json(data, max_rows=60):
+    """Convert a raw TIME_SERIES_DAILY payload into a price DataFrame.
+
+    Only the newest `max_rows` bars are materialized - the breakout checks
+    read at most the last 50, so there is no point building thousands of
+    rows out of an outputsize='full' payload (pass max_rows=None for all).
+    """
+    if not data or 'Time Series (Daily)' not in data:
+        return None
+
+    time_series = data['Time Series (Daily)']
+
+    # ISO date keys sort chronologically as plain strings
+    keys = sorted(time_series)
+    if max_rows:
+        keys = keys[-max_rows:]
+
+    rows = [time_series[k] for k in keys]
+    df = pd.DataFrame(rows, index=pd.to_datetime(keys))
+    df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+    # float32 prices halve the memory traffic of every downstream reduction
+    # (7 digits of precision vs the 2-decimal percentages we report); volume
+    # stays integral so share counts don't round
+    try:
+        df = df.astype({'Open': np.float32, 'High': np.float32,
+                        'Low': np.float32, 'Close': np.float32,
+                        'Volume': np.int64})
+    except ValueError:
+        df = df.astype(float)
+
+    return df
+
+
+@cached(ttl=DAILY_TTL)
 def get_daily_data(ticker, outputsize='compact'):
-    """Fetch daily stock data"""
+    """Fetch daily stock data (disk-cached for a day)"""
     params = {
         'function': 'TIME_SERIES_DAILY',
         'symbol': ticker,
         'apikey': API_KEY,
         'outputsize': outputsize
     }
-    
+
     try:
-        response = requests.get(BASE_URL, params=params)
-        data = response.json()
-        
-        if 'Time Series (Daily)' not in data:
-            return None
-        
-        time_series = data['Time Series (Daily)']
-        df = pd.DataFrame.from_dict(time_series, orient='index')
-        df.index = pd.to_datetime(df.index)
-        df = df.sort_index()
-        df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        df = df.astype(float)
-        
-        return df
+        response = SESSION.get(BASE_URL, params=params, timeout=30)
+        return _parse_daily_json(_decode_response(response))
     except Exception as e:
         return None
 
 
+# How many requests to keep in flight at once - stays well under the
+# premium 120 req/min Alpha Vantage limit
+FETCH_CONCURRENCY = 8
+
+
+async def _fetch_daily_json(client, semaphore, ticker, outputsize):
+    """Fetch one ticker's raw daily JSON, bounded by the shared semaphore"""
+    params = {
+        'function': 'TIME_SERIES_DAILY',
+        'symbol': ticker,
+        'apikey': API_KEY,
+        'outputsize': outputsize
+    }
+
+    async with semaphore:
+        try:
+            response = await client.get(BASE_URL, params=params)
+            return ticker, _decode_response(response)
+        except Exception:
+            return ticker, None
+
+
+async def _fetch_all_daily(tickers, outputsize):
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    async with httpx.AsyncClient(timeout=30) as client:
+        results = await asyncio.gather(
+            *[_fetch_daily_json(client, semaphore, t, outputsize) for t in tickers])
+    return dict(results)
+
+
+def fetch_all_daily(tickers, outputsize='compact'):
+    """Download daily data for many tickers concurrently.
+
+    The scan is network-bound, so issuing the requests together collapses
+    ~20 sequential round trips (plus the old per-ticker sleeps) into
+    roughly the latency of the slowest single request.
+    """
+    # Serve what we can from the disk cache and only fetch the misses
+    results = {}
+    to_fetch = []
+    for ticker in tickers:
+        hit = CACHE.get(f'daily:{ticker}:{outputsize}', DAILY_TTL)
+        if hit is not None:
+            results[ticker] = hit
+        else:
+            to_fetch.append(ticker)
+
+    if to_fetch:
+        raw = asyncio.run(_fetch_all_daily(to_fetch, outputsize))
+        for ticker, data in raw.items():
+            df = _parse_daily_json(data)
+            results[ticker] = df
+            CACHE.set(f'daily:{ticker}:{outputsize}', df)
+
+    return results
+
+
+@cached(ttl=NEWS_TTL)
 def get_news_sentiment(ticker):
-    """Get news and sentiment for a ticker"""
+    """Get news and sentiment for a ticker (disk-cached for an hour)"""
     params = {
         'function': 'NEWS_SENTIMENT',
         'tickers': ticker,
@@ -102,8 +252,8 @@ def get_news_sentiment(ticker):
     }
     
     try:
-        response = requests.get(BASE_URL, params=params)
-        data = response.json()
+        response = SESSION.get(BASE_URL, params=params, timeout=30)
+        data = _decode_response(response)
         
         if 'feed' not in data:
             return None
@@ -113,31 +263,28 @@ def get_news_sentiment(ticker):
         if not news_items:
             return None
         
-        # Calculate sentiment scores
-        sentiments = []
-        recent_news = []
-        
-        for item in news_items[:5]:  # Top 5 news items
-            ticker_sentiment = None
-            for ticker_data in item.get('ticker_sentiment', []):
-                if ticker_data['ticker'] == ticker:
-                    ticker_sentiment = float(ticker_data.get('ticker_sentiment_score', 0))
-                    break
-            
-            if ticker_sentiment:
-                sentiments.append(ticker_sentiment)
-                recent_news.append({
-                    'title': item.get('title', ''),
-                    'sentiment': ticker_sentiment,
-                    'time': item.get('time_published', '')
-                })
-        
-        if not sentiments:
+        # Collect this ticker's (score, item) pairs in one flattened
+        # comprehension and average the scores as an array, instead of
+        # nested Python loops with running accumulators
+        matches = [(float(ts.get('ticker_sentiment_score', 0)), item)
+                   for item in news_items[:5]  # Top 5 news items
+                   for ts in item.get('ticker_sentiment', [])
+                   if ts['ticker'] == ticker]
+        matches = [(score, item) for score, item in matches if score]
+
+        if not matches:
             return None
-        
+
+        scores = np.array([score for score, _ in matches])
+        recent_news = [{
+            'title': item.get('title', ''),
+            'sentiment': score,
+            'time': item.get('time_published', '')
+        } for score, item in matches]
+
         return {
-            'avg_sentiment': sum(sentiments) / len(sentiments),
-            'news_count': len(sentiments),
+            'avg_sentiment': float(scores.mean()),
+            'news_count': len(scores),
             'recent_news': recent_news
         }
     
@@ -145,21 +292,23 @@ def get_news_sentiment(ticker):
         return None
 
 
-def analyze_sector_strength(ticker):
-    """Quick sector strength analysis"""
-    df = get_daily_data(ticker)
-    
+def analyze_sector_strength(ticker, df=None):
+    """Quick sector strength analysis (accepts a DataFrame or Bars)"""
+    if df is None:
+        df = get_daily_data(ticker)
+
     if df is None or len(df) < 20:
         return None
-    
-    recent_20 = df.tail(20).copy()
-    recent_5 = df.tail(5).copy()
-    
-    price_1d = ((recent_20.iloc[-1]['Close'] - recent_20.iloc[-2]['Close']) / recent_20.iloc[-2]['Close']) * 100
-    price_5d = ((recent_5.iloc[-1]['Close'] - recent_5.iloc[0]['Close']) / recent_5.iloc[0]['Close']) * 100
-    
+
+    # Work on the raw close array - each .iloc[...]['Close'] lookup builds
+    # a throwaway pandas row just to read one number
+    close = df.close if isinstance(df, Bars) else df['Close'].to_numpy()
+
+    price_1d = ((close[-1] - close[-2]) / close[-2]) * 100
+    price_5d = ((close[-1] - close[-5]) / close[-5]) * 100
+
     momentum_score = (price_1d * 0.5) + (price_5d * 0.5)
-    
+
     return momentum_score
 
 
@@ -170,37 +319,34 @@ def check_breakout_quality(df, ticker):
     """
     if df is None or len(df) < 30:
         return None
-    
-    recent = df.tail(50).copy()
-    
-    # Calculate indicators
-    recent['SMA_10'] = recent['Close'].rolling(window=10).mean()
-    recent['SMA_20'] = recent['Close'].rolling(window=20).mean()
-    recent['SMA_50'] = recent['Close'].rolling(window=50).mean()
-    
-    today = recent.iloc[-1]
-    today_date = recent.index[-1]
-    lookback_data = recent.iloc[-21:-1]
-    
-    # Basic metrics
-    prev_high = lookback_data['High'].max()
-    avg_volume = lookback_data['Volume'].mean()
-    
+
+    # Work on struct-of-arrays bars - one compiled pass over the raw arrays
+    # replaces three pandas rolling windows (of which only the last value
+    # was ever read) plus the per-field scalar lookups
+    bars = (df if isinstance(df, Bars) else Bars.from_frame(df)).tail(50)
+    close = bars.close
+    vol = bars.volume
+
+    (breakout_pct, volume_ratio, sma_10, sma_20, sma_50,
+     prev_high, avg_volume, price_range) = compute_breakout_indicators(
+        close, bars.high, bars.low, vol.astype(np.float64))
+
+    today_close = close[-1]
+    today_date = pd.Timestamp(bars.index[-1])
+
     # Breakout criteria
-    price_breakout = today['Close'] > prev_high
-    volume_spike = today['Volume'] > avg_volume * 1.5
-    above_sma10 = today['Close'] > today['SMA_10'] if not pd.isna(today['SMA_10']) else False
-    above_sma20 = today['Close'] > today['SMA_20'] if not pd.isna(today['SMA_20']) else False
-    uptrend = today['SMA_10'] > today['SMA_20'] if not pd.isna(today['SMA_10']) and not pd.isna(today['SMA_20']) else False
-    
+    price_breakout = today_close > prev_high
+    above_sma10 = today_close > sma_10
+    above_sma20 = today_close > sma_20
+    uptrend = sma_10 > sma_20
+
     if not price_breakout:
         return None
-    
+
     # Quality Score (0-100)
     quality_score = 0
-    
+
     # 1. Breakout strength (0-25 points)
-    breakout_pct = ((today['Close'] - prev_high) / prev_high) * 100
     if breakout_pct > 5:
         quality_score += 25
     elif breakout_pct > 3:
@@ -210,8 +356,7 @@ def check_breakout_quality(df, ticker):
     else:
         quality_score += 10
     
-    # 2. Volume confirmation (0-25 points)
-    volume_ratio = today['Volume'] / avg_volume
+    # 2. Volume confirmation (0-25 points) - volume_ratio comes from the kernel
     if volume_ratio > 3:
         quality_score += 25
     elif volume_ratio > 2:
@@ -230,10 +375,8 @@ def check_breakout_quality(df, ticker):
         quality_score += 10
     
     # 4. Consolidation quality (0-25 points)
-    # Check if stock consolidated before breakout
-    consolidation_period = lookback_data.iloc[-10:]
-    price_range = (consolidation_period['High'].max() - consolidation_period['Low'].min()) / consolidation_period['Close'].mean()
-    
+    # Check if stock consolidated before breakout (price_range comes from
+    # the kernel: range of the 10 bars before today over their mean close)
     if price_range < 0.10:  # Tight consolidation < 10%
         quality_score += 25
     elif price_range < 0.15:
@@ -243,18 +386,20 @@ def check_breakout_quality(df, ticker):
     else:
         quality_score += 5
     
+    # Convert the kernel's float32 scalars to plain floats before rounding -
+    # np.float32 survives round() and serializes as 123.69000244140625
     return {
         'ticker': ticker,
         'date': today_date.strftime('%Y-%m-%d'),
-        'close': round(today['Close'], 2),
-        'prev_high': round(prev_high, 2),
-        'breakout_pct': round(breakout_pct, 2),
-        'volume': int(today['Volume']),
+        'close': round(float(today_close), 2),
+        'prev_high': round(float(prev_high), 2),
+        'breakout_pct': round(float(breakout_pct), 2),
+        'volume': int(vol[-1]),
         'avg_volume': int(avg_volume),
-        'volume_ratio': round(volume_ratio, 2),
+        'volume_ratio': round(float(volume_ratio), 2),
         'quality_score': quality_score,
-        'sma_10': round(today['SMA_10'], 2) if not pd.isna(today['SMA_10']) else 0,
-        'sma_20': round(today['SMA_20'], 2) if not pd.isna(today['SMA_20']) else 0,
+        'sma_10': round(float(sma_10), 2),
+        'sma_20': round(float(sma_20), 2),
     }
 
 
@@ -269,16 +414,19 @@ def main():
     print("STEP 1: Analyzing sector strength...")
     print("-" * 80)
     
+    # All ETF downloads go out concurrently; the analysis itself is quick
+    # local math
+    etf_data = fetch_all_daily(list(SECTOR_ETFS))
+
     sector_scores = {}
     for etf, sector_name in SECTOR_ETFS.items():
         print(f"Analyzing {sector_name} ({etf})...", end=' ')
-        momentum = analyze_sector_strength(etf)
+        momentum = analyze_sector_strength(etf, etf_data.get(etf))
         if momentum:
             sector_scores[sector_name] = momentum
             print(f"Momentum: {momentum:+.2f}")
         else:
             print("Failed")
-        time.sleep(0.5)
     
     if not sector_scores:
         print("\n❌ Could not analyze sectors")
@@ -307,43 +455,51 @@ def main():
     print(f"\nSTEP 2: Scanning stocks in {strongest_sector[0]} sector...")
     print("-" * 80)
     
+    # Download every stock in the sector concurrently before scanning
+    stock_data = fetch_all_daily(sector_stocks)
+
+    # Pass 1: breakout check is pure local math, so run it over everything
+    # first - the (expensive) news lookups only happen for actual breakouts
     breakout_candidates = []
-    
+
     for ticker in sector_stocks:
         print(f"Scanning {ticker}...", end=' ')
-        
-        df = get_daily_data(ticker)
-        breakout = check_breakout_quality(df, ticker)
-        
+
+        breakout = check_breakout_quality(stock_data.get(ticker), ticker)
+
         if breakout:
-            # Step 3: Get news sentiment
-            print("✓ Breakout found, checking news...", end=' ')
-            news = get_news_sentiment(ticker)
-            
+            print("✓ Breakout found")
+            breakout_candidates.append(breakout)
+        else:
+            print("- No breakout")
+
+    # Pass 2 (Step 3): news sentiment, fanned out concurrently across the
+    # candidates instead of one blocking lookup per breakout
+    if breakout_candidates:
+        print(f"\nChecking news for {len(breakout_candidates)} breakout candidate(s)...")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            news_results = list(executor.map(
+                get_news_sentiment, [b['ticker'] for b in breakout_candidates]))
+
+        for breakout, news in zip(breakout_candidates, news_results):
             if news:
                 breakout['news_sentiment'] = round(news['avg_sentiment'], 3)
                 breakout['news_count'] = news['news_count']
                 breakout['has_news'] = True
-                
+
                 # Adjust quality score based on sentiment
                 if news['avg_sentiment'] > 0.2:
                     breakout['quality_score'] += 10  # Bonus for positive news
                 elif news['avg_sentiment'] < -0.2:
                     breakout['quality_score'] -= 10  # Penalty for negative news
-                
-                print(f"✓ News sentiment: {news['avg_sentiment']:+.3f}")
+
+                print(f"   {breakout['ticker']}: ✓ News sentiment {news['avg_sentiment']:+.3f}")
             else:
                 breakout['news_sentiment'] = 0
                 breakout['news_count'] = 0
                 breakout['has_news'] = False
-                print("⚠️  No recent news")
-            
-            breakout_candidates.append(breakout)
-        else:
-            print("- No breakout")
-        
-        time.sleep(0.5)
-    
+                print(f"   {breakout['ticker']}: ⚠️  No recent news")
+
     if not breakout_candidates:
         print(f"\n❌ No breakouts found in {strongest_sector[0]} sector")
         return
@@ -379,8 +535,21 @@ def main():
     csv_file = f"smart_breakout_{strongest_sector[0].lower().replace(' ', '_')}_{timestamp}.csv"
     json_file = f"smart_breakout_{strongest_sector[0].lower().replace(' ', '_')}_{timestamp}.json"
     
-    df_results.to_csv(csv_file, index=False)
-    df_results.to_json(json_file, orient='records', indent=2)
+    # Write both result files in parallel; orjson skips pandas' slow
+    # Python-level pretty-printing for the JSON side
+    def _write_json():
+        if orjson:
+            with open(json_file, 'wb') as f:
+                f.write(orjson.dumps(df_results.to_dict(orient='records'),
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            df_results.to_json(json_file, orient='records', indent=2)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fut_csv = executor.submit(df_results.to_csv, csv_file, index=False)
+        fut_json = executor.submit(_write_json)
+        fut_csv.result()
+        fut_json.result()
     
     print("\n" + "=" * 80)
     print(f"✅ Results saved to:")
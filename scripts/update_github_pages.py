@@ -11,43 +11,75 @@ from datetime import datetime
 import glob
 from zoneinfo import ZoneInfo
 
+# orjson reads/writes the page payload several times faster than stdlib
+# json - fall back to stdlib if it's not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def newest(pattern):
+    """Return the newest file matching the pattern, or None.
+
+    One max() pass over the glob instead of stat-sorting every match just to
+    take the first element.
+    """
+    paths = glob.glob(pattern)
+    return max(paths, key=os.path.getmtime) if paths else None
+
+
+def _load_json(path):
+    """Load a JSON file (orjson when available)"""
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def publish(src, dst):
+    """Publish a file into docs/ via hard link, falling back to a copy.
+
+    A hard link is O(1) with zero data movement; the copy fallback covers
+    cross-device setups where linking isn't possible.
+    """
+    try:
+        if os.path.exists(dst):
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
+
 def update_github_pages():
     """Copy latest scan results to docs folder for GitHub Pages"""
-    
+
     # Create docs directory if it doesn't exist
     os.makedirs('docs', exist_ok=True)
-    
+
     # Find the most recent files
-    json_files = sorted(glob.glob('data/historical/sector_rotation_*.json'), key=os.path.getmtime, reverse=True)
-    chart_files = sorted(glob.glob('output/charts/sector_rotation_chart_*.png'), key=os.path.getmtime, reverse=True)
-    heatmap_files = sorted(glob.glob('output/heatmaps/sector_heatmap_*.png'), key=os.path.getmtime, reverse=True)
-    ai_analysis_files = sorted(glob.glob('output/reports/ai_market_analysis_*.json'), key=os.path.getmtime, reverse=True)
-    
+    latest_json = newest('data/historical/sector_rotation_*.json')
+    latest_chart = newest('output/charts/sector_rotation_chart_*.png')
+    latest_heatmap = newest('output/heatmaps/sector_heatmap_*.png')
+    latest_ai_analysis = newest('output/reports/ai_market_analysis_*.json')
+
     # Check for historical momentum chart
     historical_chart = 'output/charts/historical_market_momentum.png' if os.path.exists('output/charts/historical_market_momentum.png') else None
-    
-    if not json_files:
+
+    if not latest_json:
         print("❌ No sector rotation data found. Run sector_rotation_scanner.py first.")
         return
     
-    latest_json = json_files[0]
-    latest_chart = chart_files[0] if chart_files else None
-    latest_heatmap = heatmap_files[0] if heatmap_files else None
-    latest_ai_analysis = ai_analysis_files[0] if ai_analysis_files else None
-    
     print(f"📊 Found latest data: {latest_json}")
-    
+
     # Load the JSON data
-    with open(latest_json, 'r') as f:
-        sector_data = json.load(f)
-    
+    sector_data = _load_json(latest_json)
+
     # Load AI analysis if available
     ai_analysis_text = None
     if latest_ai_analysis:
         print(f"🤖 Found AI analysis: {latest_ai_analysis}")
-        with open(latest_ai_analysis, 'r') as f:
-            ai_data = json.load(f)
-            ai_analysis_text = ai_data.get('ai_analysis', '')
+        ai_analysis_text = _load_json(latest_ai_analysis).get('ai_analysis', '')
     
     # Create the latest_data.json for GitHub Pages
     # Use CET timezone for the timestamp
@@ -61,23 +93,27 @@ def update_github_pages():
     }
     
     # Save to docs folder
-    with open('docs/latest_data.json', 'w') as f:
-        json.dump(page_data, f, indent=2)
+    if orjson:
+        with open('docs/latest_data.json', 'wb') as f:
+            f.write(orjson.dumps(page_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open('docs/latest_data.json', 'w') as f:
+            json.dump(page_data, f, indent=2)
     
     print(f"✅ Updated docs/latest_data.json")
     
     # Copy image files to docs folder
     if latest_chart:
-        shutil.copy(latest_chart, f'docs/{os.path.basename(latest_chart)}')
+        publish(latest_chart, f'docs/{os.path.basename(latest_chart)}')
         print(f"✅ Copied {latest_chart} to docs/")
     
     if latest_heatmap:
-        shutil.copy(latest_heatmap, f'docs/{os.path.basename(latest_heatmap)}')
+        publish(latest_heatmap, f'docs/{os.path.basename(latest_heatmap)}')
         print(f"✅ Copied {latest_heatmap} to docs/")
     
     # Copy historical momentum chart if it exists
     if historical_chart:
-        shutil.copy(historical_chart, 'docs/historical_market_momentum.png')
+        publish(historical_chart, 'docs/historical_market_momentum.png')
         print(f"✅ Copied historical momentum chart to docs/")
     
     if latest_ai_analysis: